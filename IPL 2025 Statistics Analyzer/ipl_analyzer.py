@@ -10,39 +10,198 @@ Author: IPL Analytics Team
 Date: August 2025
 """
 
+import os
+from functools import cached_property
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set plotting style
+# Set plotting style. HUSL_PALETTE is the six-colour palette seaborn's
+# set_palette("husl") produced, hard-coded to avoid importing seaborn; to use
+# other seaborn palettes, install it and call sns.set_palette(...) instead.
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
 plt.style.use('default')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
+
+# Columns the analyzer uses, with the narrow types applied when parsing the
+# CSVs. Other columns are skipped at parse time, and the Parquet cache stores
+# these types natively so later runs skip the text parser entirely
+BATTING_DTYPES = {
+    'Player': 'category', 'Team': 'category', 'Runs': 'int16',
+    'Average': 'float32', 'Strike_Rate': 'float32',
+    'Fours': 'int16', 'Sixes': 'int16',
+}
+BOWLING_DTYPES = {
+    'Player': 'category', 'Team': 'category', 'Wickets': 'int16',
+    'Economy': 'float32', 'Average': 'float32', 'Strike_Rate': 'float32',
+}
+FIELDING_DTYPES = {
+    'Player': 'category', 'Team': 'category', 'Matches': 'int16',
+    'Catches': 'int16',
+}
+TEAM_DTYPES = {
+    'Team': 'category', 'Position': 'int16', 'Won': 'int16', 'Lost': 'int16',
+    'Points': 'int16', 'NRR': 'float32', 'Total_Runs': 'int16',
+    'Highest_Total': 'int16',
+}
+
+def _top_idx(arr, n):
+    """Positions of the n largest values in arr, largest first (ties keep row order)"""
+    n = min(n, len(arr))
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    k = np.argpartition(arr, -n)[-n:]
+    # Rows tied with the n-th value can land on either side of the partition,
+    # so gather them all and break ties by position, like nlargest(keep='first')
+    k = np.flatnonzero(arr >= arr[k].min())
+    return k[np.argsort(-arr[k], kind='stable')][:n]
 
 class IPLAnalyzer:
     """Main class for IPL 2025 statistics analysis"""
 
     def __init__(self):
-        """Initialize the analyzer and load data"""
-        self.load_data()
+        """Initialize the analyzer; datasets are loaded on first access"""
+        self._figs = {}
+        self._top_cache = {}
         print("🏏 IPL 2025 Statistics Analyzer Initialized!")
-        print(f"📊 Loaded data for {len(self.batting_df)} batsmen, {len(self.bowling_df)} bowlers")
-        print(f"🥅 {len(self.fielding_df)} fielders, and {len(self.team_df)} teams")
 
-    def load_data(self):
-        """Load all IPL 2025 datasets"""
+    @cached_property
+    def batting_df(self):
+        """Batting statistics, read on first access"""
+        return self.load_dataset('ipl_2025_batting_stats.csv', BATTING_DTYPES)
+
+    @cached_property
+    def bowling_df(self):
+        """Bowling statistics, read on first access"""
+        return self.load_dataset('ipl_2025_bowling_stats.csv', BOWLING_DTYPES)
+
+    @cached_property
+    def fielding_df(self):
+        """Fielding statistics, read on first access"""
+        return self.load_dataset('ipl_2025_fielding_stats.csv', FIELDING_DTYPES)
+
+    @cached_property
+    def team_df(self):
+        """Team standings ordered by final position, read on first access"""
+        team_df = self.load_dataset('ipl_2025_team_stats.csv', TEAM_DTYPES)
+        # Sorted once here so the summary, charts and report can rely on the order
+        return team_df.sort_values('Position', kind='stable').reset_index(drop=True)
+
+    @cached_property
+    def _batting_idx(self):
+        """Player name -> row position in batting_df"""
+        return self.player_index(self.batting_df)
+
+    @cached_property
+    def _bowling_idx(self):
+        """Player name -> row position in bowling_df"""
+        return self.player_index(self.bowling_df)
+
+    @staticmethod
+    def player_index(df):
+        """Map each player to their first row position in df"""
+        index = {}
+        for i, player in enumerate(df['Player'].to_numpy(copy=False)):
+            index.setdefault(player, i)
+        return index
+
+    def load_dataset(self, csv_path, dtypes):
+        """Load a single IPL 2025 dataset"""
         try:
-            self.batting_df = pd.read_csv('ipl_2025_batting_stats.csv')
-            self.bowling_df = pd.read_csv('ipl_2025_bowling_stats.csv')
-            self.fielding_df = pd.read_csv('ipl_2025_fielding_stats.csv')
-            self.team_df = pd.read_csv('ipl_2025_team_stats.csv')
-            print("✅ All datasets loaded successfully!")
+            # A RangeIndex keeps positional and label lookups on pandas' fast path
+            df = self.read_dataset(csv_path, dtypes).reset_index(drop=True)
         except FileNotFoundError as e:
             print(f"❌ Error loading data: {e}")
             print("Please ensure all CSV files are in the current directory")
+            raise
+
+        # Teams are stored as integer codes so value_counts/groupby avoid per-row
+        # string work, whichever path (cache or CSV) produced the frame
+        df['Team'] = df['Team'].astype('category')
+        return df
+
+    @staticmethod
+    def read_dataset(csv_path, dtypes):
+        """Read a dataset through its Parquet cache, building it from the CSV if needed"""
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        columns = list(dtypes)
+        try:
+            if (os.path.exists(parquet_path)
+                    and (not os.path.exists(csv_path)
+                         or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))):
+                try:
+                    return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+                except (OSError, ValueError, KeyError):
+                    # Unreadable cache or one built with other columns; rebuild it below
+                    pass
+            df = pd.read_csv(csv_path, usecols=columns, dtype=dtypes, engine='pyarrow')
+        except ImportError:
+            # pyarrow is optional; without it fall back to parsing the CSV every run
+            return pd.read_csv(csv_path, usecols=columns, dtype=dtypes)
+
+        try:
+            df.to_parquet(parquet_path, compression='zstd')
+        except OSError:
+            # The cache is best-effort, e.g. the data directory may be read-only
+            pass
+        return df
+
+    def _top(self, kind, n, by):
+        """Top n rows of a dataset by the given column, memoized per (kind, n, by)"""
+        key = (kind, n, by)
+        top = self._top_cache.get(key)
+        if top is None:
+            df = getattr(self, f'{kind}_df')
+            column = df[by]
+            if pd.api.types.is_numeric_dtype(column) and not column.hasnans:
+                top = df.iloc[_top_idx(column.to_numpy(copy=False), n)]
+            else:
+                top = df.nlargest(n, by)
+            self._top_cache[key] = top
+        return top
+
+    def _top_batting(self, n):
+        """Full rows of the top n run scorers, shared by the tables, charts and report"""
+        return self._top('batting', n, 'Runs')
+
+    def _top_bowling(self, n):
+        """Full rows of the top n wicket takers, shared by the tables, charts and report"""
+        return self._top('bowling', n, 'Wickets')
+
+    def _figure(self, key, nrows=1, ncols=1, figsize=None):
+        """Figure and axes for a chart, reused (and cleared) while its window stays open"""
+        entry = self._figs.get(key)
+        if entry is not None and plt.fignum_exists(entry[0].number):
+            fig, axes = entry
+            for ax in np.ravel(axes):
+                ax.clear()
+            # Make it pyplot's current figure again, as a freshly created one would be
+            plt.figure(fig)
+            return fig, axes
+
+        fig, axes = plt.subplots(nrows, ncols, figsize=figsize, layout='constrained')
+        self._figs[key] = (fig, axes)
+        return fig, axes
+
+    @staticmethod
+    def _show(fig):
+        """Redraw a pooled figure in interactive sessions, otherwise show it"""
+        if plt.isinteractive():
+            fig.canvas.draw_idle()
+        else:
+            plt.show()
+
+    @staticmethod
+    def team_counts(df):
+        """Players per team in df, most first, ties in order of first appearance"""
+        teams = df['Team']
+        # Team is categorical: value_counts lists unused categories and breaks ties
+        # alphabetically, so keep only the teams present, in first-appearance order
+        counts = teams.value_counts().reindex(teams.drop_duplicates())
+        return counts.sort_values(ascending=False, kind='stable')
 
     def display_summary(self):
         """Display tournament summary and key statistics"""
@@ -54,11 +213,13 @@ class IPLAnalyzer:
         print("🥇 Champion: Royal Challengers Bengaluru")
         print("🥈 Runner-up: Punjab Kings")
         print("🏃 Final Margin: 6 runs")
+        print(f"📊 Data for {len(self.batting_df)} batsmen, {len(self.bowling_df)} bowlers, "
+              f"{len(self.fielding_df)} fielders, and {len(self.team_df)} teams")
 
         # Individual awards
-        orange_cap = self.batting_df.loc[self.batting_df['Runs'].idxmax()]
-        purple_cap = self.bowling_df.loc[self.bowling_df['Wickets'].idxmax()]
-        best_fielder = self.fielding_df.loc[self.fielding_df['Catches'].idxmax()]
+        orange_cap = self._top_batting(1).iloc[0]
+        purple_cap = self._top_bowling(1).iloc[0]
+        best_fielder = self._top('fielding', 1, 'Catches').iloc[0]
 
         print(f"\n🟠 Orange Cap: {orange_cap['Player']} ({orange_cap['Team']}) - {orange_cap['Runs']} runs")
         print(f"🟣 Purple Cap: {purple_cap['Player']} ({purple_cap['Team']}) - {purple_cap['Wickets']} wickets")
@@ -67,8 +228,9 @@ class IPLAnalyzer:
         # Team standings top 4
         print("\n📊 POINTS TABLE (Top 4):")
         top_4 = self.team_df.head(4)
-        for _, team in top_4.iterrows():
-            print(f"{team['Position']}. {team['Team']} - {team['Points']} pts (NRR: {team['NRR']:+.3f})")
+        columns = (top_4[col].to_numpy(copy=False) for col in ['Position', 'Team', 'Points', 'NRR'])
+        for position, team, points, nrr in zip(*columns):
+            print(f"{position}. {team} - {points} pts (NRR: {nrr:+.3f})")
 
     def top_performers(self, category='batting', n=10):
         """Display top performers in different categories"""
@@ -76,31 +238,32 @@ class IPLAnalyzer:
         print("-" * 50)
 
         if category.lower() == 'batting':
-            top = self.batting_df.nlargest(n, 'Runs')[['Player', 'Team', 'Runs', 'Average', 'Strike_Rate']]
-            print(top.to_string(index=False))
+            top = self._top_batting(n)[['Player', 'Team', 'Runs', 'Average', 'Strike_Rate']]
+            print(top.to_string(index=False, float_format='{:.2f}'.format))
 
         elif category.lower() == 'bowling':
-            top = self.bowling_df.nlargest(n, 'Wickets')[['Player', 'Team', 'Wickets', 'Economy', 'Average']]
-            print(top.to_string(index=False))
+            top = self._top_bowling(n)[['Player', 'Team', 'Wickets', 'Economy', 'Average']]
+            print(top.to_string(index=False, float_format='{:.2f}'.format))
 
         elif category.lower() == 'fielding':
-            top = self.fielding_df.nlargest(n, 'Catches')[['Player', 'Team', 'Catches', 'Matches']]
-            print(top.to_string(index=False))
+            top = self._top('fielding', n, 'Catches')[['Player', 'Team', 'Catches', 'Matches']]
+            print(top.to_string(index=False, float_format='{:.2f}'.format))
 
     def visualize_top_batsmen(self, n=10):
         """Create visualization for top batsmen"""
-        top_batsmen = self.batting_df.nlargest(n, 'Runs')
+        top_batsmen = self._top_batting(n)
 
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = self._figure('batsmen', 2, 2, figsize=(15, 10))
         fig.suptitle('IPL 2025 - Top Batsmen Analysis', fontsize=16, fontweight='bold')
+        x = np.arange(len(top_batsmen))
+        players = top_batsmen['Player']
 
         # Runs bar chart
-        axes[0,0].bar(range(len(top_batsmen)), top_batsmen['Runs'], color='skyblue')
+        axes[0,0].bar(x, top_batsmen['Runs'], color='skyblue', tick_label=players)
         axes[0,0].set_title('Total Runs')
         axes[0,0].set_xlabel('Players')
         axes[0,0].set_ylabel('Runs')
-        axes[0,0].set_xticks(range(len(top_batsmen)))
-        axes[0,0].set_xticklabels(top_batsmen['Player'], rotation=45, ha='right')
+        plt.setp(axes[0,0].get_xticklabels(), rotation=45, ha='right')
 
         # Strike Rate vs Average scatter
         axes[0,1].scatter(top_batsmen['Average'], top_batsmen['Strike_Rate'], 
@@ -110,39 +273,39 @@ class IPLAnalyzer:
         axes[0,1].set_ylabel('Strike Rate')
 
         # Boundaries analysis
-        axes[1,0].bar(range(len(top_batsmen)), top_batsmen['Fours'], 
-                     width=0.4, label='Fours', alpha=0.8)
-        axes[1,0].bar([x+0.4 for x in range(len(top_batsmen))], top_batsmen['Sixes'], 
-                     width=0.4, label='Sixes', alpha=0.8)
+        heights = np.stack([top_batsmen['Fours'].to_numpy(copy=False),
+                            top_batsmen['Sixes'].to_numpy(copy=False)])
+        for h, label, offset in zip(heights, ['Fours', 'Sixes'], [0, 0.4]):
+            axes[1,0].bar(x + offset, h, width=0.4, label=label, alpha=0.8)
         axes[1,0].set_title('Boundaries Hit')
         axes[1,0].set_xlabel('Players')
         axes[1,0].set_ylabel('Count')
-        axes[1,0].set_xticks([x+0.2 for x in range(len(top_batsmen))])
-        axes[1,0].set_xticklabels(top_batsmen['Player'], rotation=45, ha='right')
+        axes[1,0].set_xticks(x + 0.2)
+        axes[1,0].set_xticklabels(players, rotation=45, ha='right')
         axes[1,0].legend()
 
         # Team distribution
-        team_counts = top_batsmen['Team'].value_counts()
-        axes[1,1].pie(team_counts.values, labels=team_counts.index, autopct='%1.1f%%')
+        team_counts = self.team_counts(top_batsmen)
+        axes[1,1].pie(team_counts.to_numpy(copy=False), labels=team_counts.index, autopct='%1.1f%%')
         axes[1,1].set_title('Team Distribution (Top Batsmen)')
 
-        plt.tight_layout()
-        plt.show()
+        self._show(fig)
 
     def visualize_bowling_analysis(self, n=10):
         """Create visualization for bowling analysis"""
-        top_bowlers = self.bowling_df.nlargest(n, 'Wickets')
+        top_bowlers = self._top_bowling(n)
 
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = self._figure('bowling', 2, 2, figsize=(15, 10))
         fig.suptitle('IPL 2025 - Bowling Analysis', fontsize=16, fontweight='bold')
+        x = np.arange(len(top_bowlers))
+        players = top_bowlers['Player']
 
         # Wickets bar chart
-        axes[0,0].bar(range(len(top_bowlers)), top_bowlers['Wickets'], color='purple', alpha=0.7)
+        axes[0,0].bar(x, top_bowlers['Wickets'], color='purple', alpha=0.7, tick_label=players)
         axes[0,0].set_title('Total Wickets')
         axes[0,0].set_xlabel('Bowlers')
         axes[0,0].set_ylabel('Wickets')
-        axes[0,0].set_xticks(range(len(top_bowlers)))
-        axes[0,0].set_xticklabels(top_bowlers['Player'], rotation=45, ha='right')
+        plt.setp(axes[0,0].get_xticklabels(), rotation=45, ha='right')
 
         # Economy vs Wickets
         axes[0,1].scatter(top_bowlers['Economy'], top_bowlers['Wickets'], 
@@ -152,36 +315,45 @@ class IPLAnalyzer:
         axes[0,1].set_ylabel('Wickets')
 
         # Average comparison
-        axes[1,0].barh(range(len(top_bowlers)), top_bowlers['Average'], color='green', alpha=0.7)
+        axes[1,0].barh(x, top_bowlers['Average'], color='green', alpha=0.7, tick_label=players)
         axes[1,0].set_title('Bowling Average')
         axes[1,0].set_xlabel('Average')
         axes[1,0].set_ylabel('Bowlers')
-        axes[1,0].set_yticks(range(len(top_bowlers)))
-        axes[1,0].set_yticklabels(top_bowlers['Player'])
 
         # Team distribution
-        team_counts = top_bowlers['Team'].value_counts()
-        axes[1,1].pie(team_counts.values, labels=team_counts.index, autopct='%1.1f%%')
+        team_counts = self.team_counts(top_bowlers)
+        axes[1,1].pie(team_counts.to_numpy(copy=False), labels=team_counts.index, autopct='%1.1f%%')
         axes[1,1].set_title('Team Distribution (Top Bowlers)')
 
-        plt.tight_layout()
-        plt.show()
+        self._show(fig)
 
     def team_analysis(self):
         """Comprehensive team analysis visualization"""
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        fig, axes = self._figure('teams', 2, 3, figsize=(18, 12))
         fig.suptitle('IPL 2025 - Team Performance Analysis', fontsize=16, fontweight='bold')
 
+        # Pull every column once; the subplots below work on plain arrays
+        team_df = self.team_df
+        teams = team_df['Team'].to_numpy(copy=False)
+        points = team_df['Points'].to_numpy(copy=False)
+        nrr = team_df['NRR'].to_numpy(copy=False)
+        total_runs = team_df['Total_Runs'].to_numpy(copy=False)
+        won = team_df['Won'].to_numpy(copy=False)
+        lost = team_df['Lost'].to_numpy(copy=False)
+        highest_total = team_df['Highest_Total'].to_numpy(copy=False)
+        position = team_df['Position'].to_numpy(copy=False)
+        x = np.arange(len(teams))
+
         # Points table
-        axes[0,0].bar(self.team_df['Team'], self.team_df['Points'], color='gold', alpha=0.8)
+        axes[0,0].bar(x, points, tick_label=teams, color='gold', alpha=0.8)
         axes[0,0].set_title('Points Table')
         axes[0,0].set_xlabel('Teams')
         axes[0,0].set_ylabel('Points')
         axes[0,0].tick_params(axis='x', rotation=45)
 
         # Net Run Rate
-        colors = ['green' if nrr > 0 else 'red' for nrr in self.team_df['NRR']]
-        axes[0,1].bar(self.team_df['Team'], self.team_df['NRR'], color=colors, alpha=0.7)
+        colors = np.where(nrr > 0, 'green', 'red')
+        axes[0,1].bar(x, nrr, tick_label=teams, color=colors, alpha=0.7)
         axes[0,1].set_title('Net Run Rate')
         axes[0,1].set_xlabel('Teams')
         axes[0,1].set_ylabel('NRR')
@@ -189,73 +361,72 @@ class IPLAnalyzer:
         axes[0,1].axhline(y=0, color='black', linestyle='-', alpha=0.3)
 
         # Total Runs
-        axes[0,2].bar(self.team_df['Team'], self.team_df['Total_Runs'], color='orange', alpha=0.8)
+        axes[0,2].bar(x, total_runs, tick_label=teams, color='orange', alpha=0.8)
         axes[0,2].set_title('Total Runs Scored')
         axes[0,2].set_xlabel('Teams')
         axes[0,2].set_ylabel('Runs')
         axes[0,2].tick_params(axis='x', rotation=45)
 
         # Win-Loss ratio
-        axes[1,0].bar(self.team_df['Team'], self.team_df['Won'], 
-                     width=0.4, label='Won', color='green', alpha=0.8)
-        axes[1,0].bar([x+0.4 for x in range(len(self.team_df))], self.team_df['Lost'], 
-                     width=0.4, label='Lost', color='red', alpha=0.8)
+        heights = np.stack([won, lost])
+        for h, label, color, offset in zip(heights, ['Won', 'Lost'], ['green', 'red'], [0, 0.4]):
+            axes[1,0].bar(x + offset, h, width=0.4, label=label, color=color, alpha=0.8)
         axes[1,0].set_title('Wins vs Losses')
         axes[1,0].set_xlabel('Teams')
         axes[1,0].set_ylabel('Matches')
-        axes[1,0].set_xticks([x+0.2 for x in range(len(self.team_df))])
-        axes[1,0].set_xticklabels(self.team_df['Team'], rotation=45)
+        axes[1,0].set_xticks(x + 0.2)
+        axes[1,0].set_xticklabels(teams, rotation=45)
         axes[1,0].legend()
 
         # Highest totals
-        axes[1,1].bar(self.team_df['Team'], self.team_df['Highest_Total'], color='cyan', alpha=0.8)
+        axes[1,1].bar(x, highest_total, tick_label=teams, color='cyan', alpha=0.8)
         axes[1,1].set_title('Highest Team Total')
         axes[1,1].set_xlabel('Teams')
         axes[1,1].set_ylabel('Runs')
         axes[1,1].tick_params(axis='x', rotation=45)
 
         # Final positions pie chart
-        playoff_teams = self.team_df[self.team_df['Position'] <= 4]['Team']
-        non_playoff = self.team_df[self.team_df['Position'] > 4]['Team']
+        playoff_mask = position <= 4
 
         labels = ['Playoff Teams', 'Non-Playoff Teams']
-        sizes = [len(playoff_teams), len(non_playoff)]
+        sizes = [playoff_mask.sum(), (~playoff_mask).sum()]
         colors = ['lightgreen', 'lightcoral']
 
         axes[1,2].pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
         axes[1,2].set_title('Playoff Qualification')
 
-        plt.tight_layout()
-        plt.show()
+        self._show(fig)
 
     def compare_players(self, player1, player2, category='batting'):
         """Compare two players performance"""
         if category.lower() == 'batting':
             df = self.batting_df
+            index = self._batting_idx
             metrics = ['Runs', 'Average', 'Strike_Rate', 'Fours', 'Sixes']
         elif category.lower() == 'bowling':
             df = self.bowling_df
+            index = self._bowling_idx
             metrics = ['Wickets', 'Economy', 'Average', 'Strike_Rate']
         else:
             print("Category must be 'batting' or 'bowling'")
             return
 
         try:
-            p1_data = df[df['Player'] == player1].iloc[0]
-            p2_data = df[df['Player'] == player2].iloc[0]
-        except IndexError:
+            i1, i2 = index[player1], index[player2]
+        except KeyError:
             print("One or both players not found in the dataset")
             return
 
-        p1_values = [p1_data[metric] for metric in metrics]
-        p2_values = [p2_data[metric] for metric in metrics]
+        # One positional gather for both players instead of two boolean-mask scans
+        p1_values, p2_values = df.iloc[[i1, i2]][metrics].to_numpy(copy=False)
+        p1_team, p2_team = df['Team'].iat[i1], df['Team'].iat[i2]
 
         x = np.arange(len(metrics))
         width = 0.35
 
-        fig, ax = plt.subplots(figsize=(12, 6))
-        bars1 = ax.bar(x - width/2, p1_values, width, label=f"{player1} ({p1_data['Team']})", alpha=0.8)
-        bars2 = ax.bar(x + width/2, p2_values, width, label=f"{player2} ({p2_data['Team']})", alpha=0.8)
+        fig, ax = self._figure('compare', figsize=(12, 6))
+        bars1 = ax.bar(x - width/2, p1_values, width, label=f"{player1} ({p1_team})", alpha=0.8)
+        bars2 = ax.bar(x + width/2, p2_values, width, label=f"{player2} ({p2_team})", alpha=0.8)
 
         ax.set_xlabel('Metrics')
         ax.set_ylabel('Values')
@@ -274,56 +445,56 @@ class IPLAnalyzer:
                            textcoords="offset points",
                            ha='center', va='bottom', fontsize=8)
 
-        plt.tight_layout()
-        plt.show()
+        self._show(fig)
 
     def generate_report(self, filename='ipl_2025_analysis_report.txt'):
         """Generate a comprehensive text report"""
-        with open(filename, 'w') as f:
-            f.write("IPL 2025 COMPREHENSIVE ANALYSIS REPORT\n")
-            f.write("="*50 + "\n\n")
-            f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # Tournament Summary
-            f.write("TOURNAMENT SUMMARY\n")
-            f.write("-" * 20 + "\n")
-            f.write("Champion: Royal Challengers Bengaluru\n")
-            f.write("Runner-up: Punjab Kings\n")
-            f.write("Total Teams: 10\n")
-            f.write("Total Matches: 74\n\n")
-
-            # Individual Awards
-            orange_cap = self.batting_df.loc[self.batting_df['Runs'].idxmax()]
-            purple_cap = self.bowling_df.loc[self.bowling_df['Wickets'].idxmax()]
-            best_fielder = self.fielding_df.loc[self.fielding_df['Catches'].idxmax()]
-
-            f.write("INDIVIDUAL AWARDS\n")
-            f.write("-" * 20 + "\n")
-            f.write(f"Orange Cap: {orange_cap['Player']} ({orange_cap['Team']}) - {orange_cap['Runs']} runs\n")
-            f.write(f"Purple Cap: {purple_cap['Player']} ({purple_cap['Team']}) - {purple_cap['Wickets']} wickets\n")
-            f.write(f"Best Fielder: {best_fielder['Player']} ({best_fielder['Team']}) - {best_fielder['Catches']} catches\n\n")
-
-            # Team Standings
-            f.write("FINAL POINTS TABLE\n")
-            f.write("-" * 20 + "\n")
-            for _, team in self.team_df.iterrows():
-                f.write(f"{team['Position']:2d}. {team['Team']:<4} - {team['Points']:2d} pts | "
-                       f"W: {team['Won']:2d} L: {team['Lost']:2d} | NRR: {team['NRR']:+.3f}\n")
-
-            # Top Performers
-            f.write("\nTOP 5 BATSMEN\n")
-            f.write("-" * 20 + "\n")
-            top_batsmen = self.batting_df.nlargest(5, 'Runs')
-            for _, player in top_batsmen.iterrows():
-                f.write(f"{player['Player']:<20} ({player['Team']}) - "
-                       f"{player['Runs']:3d} runs @ {player['Average']:.2f} avg, SR: {player['Strike_Rate']:.2f}\n")
-
-            f.write("\nTOP 5 BOWLERS\n")
-            f.write("-" * 20 + "\n")
-            top_bowlers = self.bowling_df.nlargest(5, 'Wickets')
-            for _, player in top_bowlers.iterrows():
-                f.write(f"{player['Player']:<20} ({player['Team']}) - "
-                       f"{player['Wickets']:2d} wickets @ {player['Average']:.2f} avg, Econ: {player['Economy']:.2f}\n")
+        lines = []
+        lines.append("IPL 2025 COMPREHENSIVE ANALYSIS REPORT\n")
+        lines.append("="*50 + "\n\n")
+        lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        # Tournament Summary
+        lines.append("TOURNAMENT SUMMARY\n")
+        lines.append("-" * 20 + "\n")
+        lines.append("Champion: Royal Challengers Bengaluru\n")
+        lines.append("Runner-up: Punjab Kings\n")
+        lines.append("Total Teams: 10\n")
+        lines.append("Total Matches: 74\n\n")
+
+        # Individual Awards
+        orange_cap = self._top_batting(1).iloc[0]
+        purple_cap = self._top_bowling(1).iloc[0]
+        best_fielder = self._top('fielding', 1, 'Catches').iloc[0]
+
+        lines.append("INDIVIDUAL AWARDS\n")
+        lines.append("-" * 20 + "\n")
+        lines.append(f"Orange Cap: {orange_cap['Player']} ({orange_cap['Team']}) - {orange_cap['Runs']} runs\n")
+        lines.append(f"Purple Cap: {purple_cap['Player']} ({purple_cap['Team']}) - {purple_cap['Wickets']} wickets\n")
+        lines.append(f"Best Fielder: {best_fielder['Player']} ({best_fielder['Team']}) - {best_fielder['Catches']} catches\n\n")
+
+        # Team Standings
+        lines.append("FINAL POINTS TABLE\n")
+        lines.append("-" * 20 + "\n")
+        lines.append(self.team_df[['Position', 'Team', 'Points', 'Won', 'Lost', 'NRR']]
+                     .to_string(index=False, formatters={'NRR': '{:+.3f}'.format}) + "\n")
+
+        # Top Performers
+        two_dp = '{:.2f}'.format
+        lines.append("\nTOP 5 BATSMEN\n")
+        lines.append("-" * 20 + "\n")
+        top_batsmen = self._top_batting(5)
+        lines.append(top_batsmen[['Player', 'Team', 'Runs', 'Average', 'Strike_Rate']]
+                     .to_string(index=False, formatters={'Average': two_dp, 'Strike_Rate': two_dp}) + "\n")
+
+        lines.append("\nTOP 5 BOWLERS\n")
+        lines.append("-" * 20 + "\n")
+        top_bowlers = self._top_bowling(5)
+        lines.append(top_bowlers[['Player', 'Team', 'Wickets', 'Average', 'Economy']]
+                     .to_string(index=False, formatters={'Average': two_dp, 'Economy': two_dp}) + "\n")
+
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.writelines(lines)
 
         print(f"📄 Report generated: {filename}")
 
@@ -335,47 +506,52 @@ def main():
     # Initialize analyzer
     analyzer = IPLAnalyzer()
 
+    def compare_from_input():
+        """Prompt for a category and two players, then compare them"""
+        print("Available categories: batting, bowling")
+        category = input("Enter category: ").strip()
+        player1 = input("Enter first player name: ").strip()
+        player2 = input("Enter second player name: ").strip()
+        analyzer.compare_players(player1, player2, category)
+
+    dispatch = {
+        '1': analyzer.display_summary,
+        '2': lambda: analyzer.top_performers('batting'),
+        '3': lambda: analyzer.top_performers('bowling'),
+        '4': lambda: analyzer.top_performers('fielding'),
+        '5': analyzer.visualize_top_batsmen,
+        '6': analyzer.visualize_bowling_analysis,
+        '7': analyzer.team_analysis,
+        '8': compare_from_input,
+        '9': analyzer.generate_report,
+    }
+    menu = "\n".join([
+        "\n📋 MENU OPTIONS:",
+        "1. Tournament Summary",
+        "2. Top Batting Performers",
+        "3. Top Bowling Performers",
+        "4. Top Fielding Performers",
+        "5. Visualize Top Batsmen",
+        "6. Visualize Bowling Analysis",
+        "7. Team Analysis",
+        "8. Compare Players",
+        "9. Generate Report",
+        "0. Exit",
+    ])
+
     # Interactive menu
     while True:
-        print("\n📋 MENU OPTIONS:")
-        print("1. Tournament Summary")
-        print("2. Top Batting Performers")
-        print("3. Top Bowling Performers")
-        print("4. Top Fielding Performers")
-        print("5. Visualize Top Batsmen")
-        print("6. Visualize Bowling Analysis")
-        print("7. Team Analysis")
-        print("8. Compare Players")
-        print("9. Generate Report")
-        print("0. Exit")
+        print(menu)
 
         choice = input("\nEnter your choice (0-9): ").strip()
 
-        if choice == '1':
-            analyzer.display_summary()
-        elif choice == '2':
-            analyzer.top_performers('batting')
-        elif choice == '3':
-            analyzer.top_performers('bowling')
-        elif choice == '4':
-            analyzer.top_performers('fielding')
-        elif choice == '5':
-            analyzer.visualize_top_batsmen()
-        elif choice == '6':
-            analyzer.visualize_bowling_analysis()
-        elif choice == '7':
-            analyzer.team_analysis()
-        elif choice == '8':
-            print("Available categories: batting, bowling")
-            category = input("Enter category: ").strip()
-            player1 = input("Enter first player name: ").strip()
-            player2 = input("Enter second player name: ").strip()
-            analyzer.compare_players(player1, player2, category)
-        elif choice == '9':
-            analyzer.generate_report()
-        elif choice == '0':
+        if choice == '0':
             print("🙏 Thank you for using IPL 2025 Statistics Analyzer!")
             break
+
+        action = dispatch.get(choice)
+        if action:
+            action()
         else:
             print("❌ Invalid choice. Please try again.")
 